@@ -2,10 +2,12 @@ from .impl import (
     SqlAlchemyReadOnlyTransactionManager,
     SqlAlchemyTransaction,
     SqlAlchemyTransactionManager,
+    ensure_async_pool,
 )
 
 __all__ = (
     "SqlAlchemyReadOnlyTransactionManager",
     "SqlAlchemyTransaction",
     "SqlAlchemyTransactionManager",
+    "ensure_async_pool",
 )
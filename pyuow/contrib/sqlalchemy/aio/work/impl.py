@@ -9,15 +9,29 @@ try:
         async_scoped_session,
         async_sessionmaker,
     )
+    from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
 except ImportError:  # pragma: no cover
     raise ImportError(
         "Seems that you are trying to import extra module that was not installed,"
         " please install pyuow[sqlalchemy]"
     )
 
+
 from .....work.aio.transactional import BaseTransaction, BaseTransactionManager
 
 
+def ensure_async_pool(engine: AsyncEngine) -> None:
+    pool = engine.pool
+
+    if isinstance(pool, QueuePool) and not isinstance(
+        pool, AsyncAdaptedQueuePool
+    ):
+        raise TypeError(
+            f"{pool.__class__.__name__} blocks the event loop on checkout,"
+            " please create the engine with AsyncAdaptedQueuePool"
+        )
+
+
 class SqlAlchemyTransaction(BaseTransaction[AsyncSession]):
     async def rollback(self) -> None:
         await self._transaction_provider.rollback()
@@ -30,11 +44,15 @@ class SqlAlchemyTransactionManager(
     BaseTransactionManager[SqlAlchemyTransaction]
 ):
     def __init__(self, engine: AsyncEngine) -> None:
+        ensure_async_pool(engine)
         self._session_factory = async_scoped_session(
             async_sessionmaker(engine, expire_on_commit=False),
             scopefunc=current_task,
         )
 
+    def in_transaction(self) -> bool:
+        return self._session_factory().in_transaction()
+
     @asynccontextmanager
     async def transaction(self) -> t.AsyncIterator[SqlAlchemyTransaction]:
         session = self._session_factory()
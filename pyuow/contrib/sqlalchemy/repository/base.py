@@ -5,7 +5,7 @@ from dataclasses import asdict
 from ....clock import offset_naive_utcnow
 
 try:
-    from sqlalchemy import delete, exists, insert, select, update
+    from sqlalchemy import bindparam, delete, insert, literal, select, update
 except ImportError:  # pragma: no cover
     raise ImportError(
         "Seems that you are trying to import extra module that was not installed,"
@@ -43,6 +43,27 @@ class BaseSqlAlchemyEntityRepository(
         self._table = table
         self._transaction_manager = transaction_manager
         self._readonly_transaction_manager = readonly_transaction_manager
+        # statement shapes are fixed per table, so they are built once
+        # here and only parameters travel per call
+        self._select_by_id = select(table).where(table.id == bindparam("id"))
+        self._select_by_ids = select(table).where(
+            table.id.in_(bindparam("ids", expanding=True))
+        )
+        self._exists_by_id = (
+            select(literal(1))
+            .where(table.id == bindparam("id"))
+            .exists()
+            .select()
+        )
+        self._insert = insert(table).returning(table)
+        self._insert_many = insert(table).returning(
+            table, sort_by_parameter_order=True
+        )
+        self._delete_by_id = (
+            delete(table)
+            .where(table.id == bindparam("id"))
+            .returning(table.id)
+        )
 
     @staticmethod
     @abstractmethod
@@ -54,56 +75,74 @@ class BaseSqlAlchemyEntityRepository(
     def to_record(entity: ENTITY_TYPE) -> ENTITY_TABLE:
         raise NotImplementedError
 
-    def find(self, entity_id: ENTITY_ID) -> t.Optional[ENTITY_TYPE]:
-        statement = select(self._table).where(self._table.id == entity_id)
+    def _reader(self) -> SqlAlchemyTransactionManager:
+        # reads issued inside an open transaction must join it, both to
+        # observe uncommitted writes and to reuse its connection
+        if self._transaction_manager.in_transaction():
+            return self._transaction_manager
+
+        return self._readonly_transaction_manager
 
-        with self._readonly_transaction_manager.transaction() as trx:
-            result = (trx.it().execute(statement)).scalar_one_or_none()
+    def find(self, entity_id: ENTITY_ID) -> t.Optional[ENTITY_TYPE]:
+        with self._reader().transaction() as trx:
+            result = (
+                trx.it().execute(self._select_by_id, {"id": entity_id})
+            ).scalar_one_or_none()
 
         return self.to_entity(result) if result else None
 
     def find_all(
         self, entity_ids: t.Iterable[ENTITY_ID]
     ) -> t.Iterable[ENTITY_TYPE]:
-        statement = select(self._table).where(self._table.id.in_(entity_ids))
-
-        with self._readonly_transaction_manager.transaction() as trx:
-            result = (trx.it().execute(statement)).scalars().all()
+        with self._reader().transaction() as trx:
+            result = (
+                (
+                    trx.it().execute(
+                        self._select_by_ids, {"ids": list(entity_ids)}
+                    )
+                )
+                .scalars()
+                .all()
+            )
 
         return [self.to_entity(record) for record in result]
 
     def get(self, entity_id: ENTITY_ID) -> ENTITY_TYPE:
-        statement = select(self._table).where(self._table.id == entity_id)
-
-        with self._readonly_transaction_manager.transaction() as trx:
-            result = (trx.it().execute(statement)).scalar_one()
+        with self._reader().transaction() as trx:
+            result = (
+                trx.it().execute(self._select_by_id, {"id": entity_id})
+            ).scalar_one()
 
         return self.to_entity(result)
 
     def exists(self, entity_id: ENTITY_ID) -> bool:
-        statement = (
-            exists(self._table).where(self._table.id == entity_id).select()
-        )
-
-        with self._readonly_transaction_manager.transaction() as trx:
-            return (trx.it().execute(statement)).scalar() or False
+        with self._reader().transaction() as trx:
+            return (
+                trx.it().execute(self._exists_by_id, {"id": entity_id})
+            ).scalar() or False
 
     def add(self, entity: ENTITY_TYPE) -> ENTITY_TYPE:
-        statement = (
-            insert(self._table)
-            .values(**asdict(self.to_record(entity)))
-            .returning(self._table)
-        )
+        row = asdict(self.to_record(entity))
 
         with self._transaction_manager.transaction() as trx:
-            result = (trx.it().execute(statement)).scalar_one()
+            result = (trx.it().execute(self._insert, row)).scalar_one()
 
         return self.to_entity(result)
 
     def add_all(
         self, entities: t.Sequence[ENTITY_TYPE]
     ) -> t.Iterable[ENTITY_TYPE]:
-        return [self.add(entity) for entity in entities]
+        if not entities:
+            return []
+
+        rows = [asdict(self.to_record(entity)) for entity in entities]
+
+        with self._transaction_manager.transaction() as trx:
+            result = (
+                (trx.it().execute(self._insert_many, rows)).scalars().all()
+            )
+
+        return [self.to_entity(record) for record in result]
 
     def update(self, entity: ENTITY_TYPE) -> ENTITY_TYPE:
         record = self.to_record(entity)
@@ -144,14 +183,10 @@ class BaseSqlAlchemyEntityRepository(
         return [self.update(entity) for entity in entities]
 
     def delete(self, entity: ENTITY_TYPE) -> bool:
-        statement = (
-            delete(self._table)
-            .where(self._table.id == entity.id)
-            .returning(self._table.id)
-        )
-
         with self._transaction_manager.transaction() as trx:
-            identifier = (trx.it().execute(statement)).scalar_one()
+            identifier = (
+                trx.it().execute(self._delete_by_id, {"id": entity.id})
+            ).scalar_one()
 
         return t.cast(bool, identifier == entity.id)
 
@@ -29,6 +29,9 @@ class SqlAlchemyTransactionManager(
             sessionmaker(engine, expire_on_commit=False)
         )
 
+    def in_transaction(self) -> bool:
+        return self._session_factory().in_transaction()
+
     @contextmanager
     def transaction(self) -> t.Iterator[SqlAlchemyTransaction]:
         session = self._session_factory()
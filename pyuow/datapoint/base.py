@@ -13,6 +13,15 @@ class BaseDataPointSpec(t.Generic[VALUE]):
     def __call__(self, value: VALUE) -> "BaseDataPointContainer[VALUE]":
         return BaseDataPointContainer(self, value)
 
+    def __hash__(self) -> int:
+        cached = self.__dict__.get("_hash")
+
+        if cached is None:
+            cached = hash((self.name, self.ref_type))
+            object.__setattr__(self, "_hash", cached)
+
+        return t.cast(int, cached)
+
 
 @dataclass(frozen=True)
 class BaseDataPointContainer(t.Generic[VALUE]):
@@ -13,9 +13,16 @@ from ..datapoint import (
 
 
 class ConsumesDataPoints(ABC):
+    def __init_subclass__(cls, **kwargs: t.Any) -> None:
+        super().__init_subclass__(**kwargs)
+        consumes = cls.__dict__.get("_consumes")
+
+        if isinstance(consumes, (set, frozenset)):
+            cls._consumes = frozenset(consumes)  # type: ignore[method-assign, assignment]
+
     @property
     @abstractmethod
-    def _consumes(self) -> t.Set[BaseDataPointSpec[t.Any]]:
+    def _consumes(self) -> t.AbstractSet[BaseDataPointSpec[t.Any]]:
         raise NotImplementedError
 
     def out_of(
@@ -24,7 +31,7 @@ class ConsumesDataPoints(ABC):
         consumed = consumer.get(*self._consumes)
         consumed_specs = set(consumed.keys())
 
-        if not self._consumes.issubset(consumed_specs):
+        if not self._consumes <= consumed_specs:
             missing_specs = self._consumes - consumed_specs
             raise DataPointIsNotProducedError(missing_specs)
 
@@ -32,10 +39,17 @@ class ConsumesDataPoints(ABC):
 
 
 class ProducesDataPoints(ABC):
+    def __init_subclass__(cls, **kwargs: t.Any) -> None:
+        super().__init_subclass__(**kwargs)
+        produces = cls.__dict__.get("_produces")
+
+        if isinstance(produces, (set, frozenset)):
+            cls._produces = frozenset(produces)  # type: ignore[method-assign, assignment]
+
     @dataclass(frozen=True)
     class ProducerProxy:
         _producer: BaseDataPointProducer[t.Any]
-        _required_specs: t.Set[BaseDataPointSpec[t.Any]]
+        _required_specs: t.AbstractSet[BaseDataPointSpec[t.Any]]
 
         def add(self, *datapoints: BaseDataPointContainer[t.Any]) -> None:
             actual_specs = {datapoint.spec for datapoint in datapoints}
@@ -48,7 +62,7 @@ class ProducesDataPoints(ABC):
 
     @property
     @abstractmethod
-    def _produces(self) -> t.Set[BaseDataPointSpec[t.Any]]:
+    def _produces(self) -> t.AbstractSet[BaseDataPointSpec[t.Any]]:
         raise NotImplementedError
 
     def to(self, producer: BaseDataPointProducer[t.Any]) -> ProducerProxy:
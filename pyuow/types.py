@@ -1,9 +1,11 @@
+import enum
 import typing as t
 
 
+# a single member enum so mypy can narrow `x is MISSING` identity checks
 @t.final
-class MissingType:
-    pass
+class MissingType(enum.Enum):
+    MISSING = enum.auto()
 
 
-MISSING = MissingType()
+MISSING = MissingType.MISSING
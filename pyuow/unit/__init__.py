@@ -1,9 +1,12 @@
 from .base import BaseUnit
+from .cache import BaseConditionCacheStore, cached_condition
+from .compile import jit_compiled
 from .exceptions import CannotReassignUnitError, FinalUnitError
 from .impl import ConditionalUnit, ErrorUnit, FinalUnit, FlowUnit, RunUnit
 
 __all__ = (
     "BaseUnit",
+    "BaseConditionCacheStore",
     "CannotReassignUnitError",
     "FinalUnitError",
     "ConditionalUnit",
@@ -11,4 +14,6 @@ __all__ = (
     "FinalUnit",
     "FlowUnit",
     "RunUnit",
+    "cached_condition",
+    "jit_compiled",
 )
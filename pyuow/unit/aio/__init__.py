@@ -1,11 +1,14 @@
 from .base import BaseUnit
+from .cache import BaseConditionCacheStore, cached_condition
 from .impl import ConditionalUnit, ErrorUnit, FinalUnit, FlowUnit, RunUnit
 
 __all__ = (
     "BaseUnit",
+    "BaseConditionCacheStore",
     "ConditionalUnit",
     "ErrorUnit",
     "FinalUnit",
     "FlowUnit",
     "RunUnit",
+    "cached_condition",
 )
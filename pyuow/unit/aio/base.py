@@ -10,6 +10,8 @@ OUT = t.TypeVar("OUT")
 
 
 class BaseUnit(t.Generic[CONTEXT, OUT], ABC):
+    __slots__ = ()
+
     @abc.abstractmethod
     async def __call__(self, context: CONTEXT) -> Result[OUT]:
         raise NotImplementedError
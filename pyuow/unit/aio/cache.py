@@ -0,0 +1,82 @@
+import functools
+import typing as t
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from weakref import WeakKeyDictionary
+
+from ...context.datapoint.aio import BaseDataPointConsumerContext
+from ...types import MISSING, MissingType
+from ..cache import ConditionCacheKey
+
+if t.TYPE_CHECKING:
+    from ...datapoint.aio import ConsumesDataPoints
+
+CONTEXT = t.TypeVar(
+    "CONTEXT", bound=BaseDataPointConsumerContext[t.Any, t.Any]
+)
+UNIT = t.TypeVar("UNIT", bound="ConsumesDataPoints")
+
+
+class BaseConditionCacheStore(ABC):
+    @abstractmethod
+    async def get(self, key: ConditionCacheKey) -> t.Union[bool, MissingType]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def set(self, key: ConditionCacheKey, value: bool) -> None:
+        raise NotImplementedError
+
+
+def cached_condition(
+    maxsize: int = 128,
+    store: t.Optional[BaseConditionCacheStore] = None,
+) -> t.Callable[
+    [t.Callable[[UNIT, CONTEXT], t.Coroutine[t.Any, t.Any, bool]]],
+    t.Callable[[UNIT, CONTEXT], t.Coroutine[t.Any, t.Any, bool]],
+]:
+    def decorator(
+        condition: t.Callable[
+            [UNIT, CONTEXT], t.Coroutine[t.Any, t.Any, bool]
+        ],
+    ) -> t.Callable[[UNIT, CONTEXT], t.Coroutine[t.Any, t.Any, bool]]:
+        # cache entries live and die with their unit; decorated units are
+        # weak referenceable because ConsumesDataPoints is not slotted
+        caches: t.MutableMapping[
+            t.Any, "OrderedDict[ConditionCacheKey, bool]"
+        ] = WeakKeyDictionary()
+
+        @functools.wraps(condition)
+        async def wrapper(self: UNIT, context: CONTEXT) -> bool:
+            consumed = await self.out_of(context)
+            key = tuple(
+                sorted((spec.name, value) for spec, value in consumed.items())
+            )
+
+            cache = caches.get(self)
+
+            if cache is None:
+                cache = OrderedDict()
+                caches[self] = cache
+
+            if key in cache:
+                cache.move_to_end(key)
+                return cache[key]
+
+            value = MISSING if store is None else await store.get(key)
+
+            if isinstance(value, MissingType):
+                value = await condition(self, context)
+
+                if store is not None:
+                    await store.set(key, value)
+
+            cache[key] = value
+
+            if len(cache) > maxsize:
+                cache.popitem(last=False)
+
+            return value
+
+        return wrapper
+
+    return decorator
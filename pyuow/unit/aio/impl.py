@@ -16,6 +16,8 @@ OUT = t.TypeVar("OUT")
 
 
 class FlowUnit(BaseUnit[CONTEXT, OUT], ABC):
+    __slots__ = ("_root", "_next")
+
     def __init__(self) -> None:
         self._root: "FlowUnit[CONTEXT, OUT]" = self
         self._next: t.Union["FlowUnit[CONTEXT, OUT]", MissingType] = MISSING
@@ -24,7 +26,7 @@ class FlowUnit(BaseUnit[CONTEXT, OUT], ABC):
         self: "FlowUnit[CONTEXT, OUT]",
         other: "FlowUnit[CONTEXT, OUT]",
     ) -> "FlowUnit[CONTEXT, OUT]":
-        if not isinstance(other._next, MissingType):
+        if other._next is not MISSING:
             raise CannotReassignUnitError
 
         self._next = other
@@ -36,6 +38,8 @@ class FlowUnit(BaseUnit[CONTEXT, OUT], ABC):
 
 
 class FinalUnit(FlowUnit[CONTEXT, OUT], ABC):
+    __slots__ = ()
+
     async def __call__(self, context: CONTEXT) -> Result[OUT]:
         cls_name = self.__class__.__name__
 
@@ -65,6 +69,8 @@ class FinalUnit(FlowUnit[CONTEXT, OUT], ABC):
 
 @t.final
 class ErrorUnit(FinalUnit[CONTEXT, OUT]):
+    __slots__ = ("_exc",)
+
     def __init__(
         self,
         exc: Exception,
@@ -77,14 +83,17 @@ class ErrorUnit(FinalUnit[CONTEXT, OUT]):
 
 
 class ConditionalUnit(FlowUnit[CONTEXT, OUT]):
+    __slots__ = ("_on_failure",)
+
     def __init__(self, *, on_failure: FlowUnit[CONTEXT, OUT]) -> None:
         super().__init__()
         self._on_failure = on_failure
 
     async def __call__(self, context: CONTEXT) -> Result[OUT]:
         cls_name = self.__class__.__name__
+        next_unit = self._next
 
-        if isinstance(self._next, MissingType):
+        if next_unit is MISSING:
             raise NotImplementedError(f"[{cls_name}] next unit is not set")
 
         try:
@@ -97,7 +106,7 @@ class ConditionalUnit(FlowUnit[CONTEXT, OUT]):
 
         if passed:
             logger.info("[%s] completed", cls_name)
-            return await self._next(context)
+            return await next_unit(context)
 
         logger.info("[%s] failed", cls_name)
         return await self._on_failure(context)
@@ -108,10 +117,13 @@ class ConditionalUnit(FlowUnit[CONTEXT, OUT]):
 
 
 class RunUnit(FlowUnit[CONTEXT, OUT]):
+    __slots__ = ()
+
     async def __call__(self, context: CONTEXT) -> Result[OUT]:
         cls_name = self.__class__.__name__
+        next_unit = self._next
 
-        if isinstance(self._next, MissingType):
+        if next_unit is MISSING:
             raise NotImplementedError(f"[{cls_name}] next unit is not set")
 
         try:
@@ -123,7 +135,7 @@ class RunUnit(FlowUnit[CONTEXT, OUT]):
             return Result.error(error)
 
         logger.info("[%s] completed", cls_name)
-        return await self._next(context)
+        return await next_unit(context)
 
     @abc.abstractmethod
     async def run(self, context: CONTEXT) -> None:
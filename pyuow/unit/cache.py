@@ -0,0 +1,81 @@
+import functools
+import typing as t
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from weakref import WeakKeyDictionary
+
+from ..context.datapoint import BaseDataPointConsumerContext
+from ..types import MISSING, MissingType
+
+if t.TYPE_CHECKING:
+    from ..datapoint import ConsumesDataPoints
+
+CONTEXT = t.TypeVar(
+    "CONTEXT", bound=BaseDataPointConsumerContext[t.Any, t.Any]
+)
+UNIT = t.TypeVar("UNIT", bound="ConsumesDataPoints")
+
+ConditionCacheKey = t.Tuple[t.Tuple[str, t.Any], ...]
+
+
+class BaseConditionCacheStore(ABC):
+    @abstractmethod
+    def get(self, key: ConditionCacheKey) -> t.Union[bool, MissingType]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def set(self, key: ConditionCacheKey, value: bool) -> None:
+        raise NotImplementedError
+
+
+def cached_condition(
+    maxsize: int = 128,
+    store: t.Optional[BaseConditionCacheStore] = None,
+) -> t.Callable[
+    [t.Callable[[UNIT, CONTEXT], bool]],
+    t.Callable[[UNIT, CONTEXT], bool],
+]:
+    def decorator(
+        condition: t.Callable[[UNIT, CONTEXT], bool],
+    ) -> t.Callable[[UNIT, CONTEXT], bool]:
+        # cache entries live and die with their unit; decorated units are
+        # weak referenceable because ConsumesDataPoints is not slotted
+        caches: t.MutableMapping[
+            t.Any, "OrderedDict[ConditionCacheKey, bool]"
+        ] = WeakKeyDictionary()
+
+        @functools.wraps(condition)
+        def wrapper(self: UNIT, context: CONTEXT) -> bool:
+            consumed = self.out_of(context)
+            key = tuple(
+                sorted((spec.name, value) for spec, value in consumed.items())
+            )
+
+            cache = caches.get(self)
+
+            if cache is None:
+                cache = OrderedDict()
+                caches[self] = cache
+
+            if key in cache:
+                cache.move_to_end(key)
+                return cache[key]
+
+            value = MISSING if store is None else store.get(key)
+
+            if isinstance(value, MissingType):
+                value = condition(self, context)
+
+                if store is not None:
+                    store.set(key, value)
+
+            cache[key] = value
+
+            if len(cache) > maxsize:
+                cache.popitem(last=False)
+
+            return value
+
+        return wrapper
+
+    return decorator
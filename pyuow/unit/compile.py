@@ -0,0 +1,12 @@
+import typing as t
+
+F = t.TypeVar("F", bound=t.Callable[..., t.Any])
+
+
+def jit_compiled(fn: F) -> F:
+    try:
+        from numba import njit  # type: ignore[import-not-found]
+    except ImportError:
+        return fn
+
+    return t.cast(F, njit(cache=True)(fn))
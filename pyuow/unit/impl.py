@@ -16,6 +16,8 @@ OUT = t.TypeVar("OUT")
 
 
 class FlowUnit(BaseUnit[CONTEXT, OUT], ABC):
+    __slots__ = ("_root", "_next")
+
     def __init__(self) -> None:
         self._root: "FlowUnit[CONTEXT, OUT]" = self
         self._next: t.Union["FlowUnit[CONTEXT, OUT]", MissingType] = MISSING
@@ -23,7 +25,7 @@ class FlowUnit(BaseUnit[CONTEXT, OUT], ABC):
     def __rshift__(
         self: "FlowUnit[CONTEXT, OUT]", other: "FlowUnit[CONTEXT, OUT]"
     ) -> "FlowUnit[CONTEXT, OUT]":
-        if not isinstance(other._next, MissingType):
+        if other._next is not MISSING:
             raise CannotReassignUnitError
 
         self._next = other
@@ -35,6 +37,8 @@ class FlowUnit(BaseUnit[CONTEXT, OUT], ABC):
 
 
 class FinalUnit(FlowUnit[CONTEXT, OUT], ABC):
+    __slots__ = ()
+
     def __call__(self, context: CONTEXT) -> Result[OUT]:
         cls_name = self.__class__.__name__
 
@@ -63,6 +67,8 @@ class FinalUnit(FlowUnit[CONTEXT, OUT], ABC):
 
 @t.final
 class ErrorUnit(FinalUnit[CONTEXT, OUT]):
+    __slots__ = ("_exc",)
+
     def __init__(
         self,
         exc: Exception,
@@ -75,14 +81,17 @@ class ErrorUnit(FinalUnit[CONTEXT, OUT]):
 
 
 class ConditionalUnit(FlowUnit[CONTEXT, OUT]):
+    __slots__ = ("_on_failure",)
+
     def __init__(self, *, on_failure: FlowUnit[CONTEXT, OUT]) -> None:
         super().__init__()
         self._on_failure = on_failure
 
     def __call__(self, context: CONTEXT) -> Result[OUT]:
         cls_name = self.__class__.__name__
+        next_unit = self._next
 
-        if isinstance(self._next, MissingType):
+        if next_unit is MISSING:
             raise NotImplementedError(f"[{cls_name}] next unit is not set")
 
         try:
@@ -95,7 +104,7 @@ class ConditionalUnit(FlowUnit[CONTEXT, OUT]):
 
         if passed:
             logger.info("[%s] completed", cls_name)
-            return self._next(context)
+            return next_unit(context)
 
         logger.info("[%s] failed", cls_name)
         return self._on_failure(context)
@@ -106,10 +115,13 @@ class ConditionalUnit(FlowUnit[CONTEXT, OUT]):
 
 
 class RunUnit(FlowUnit[CONTEXT, OUT]):
+    __slots__ = ()
+
     def __call__(self, context: CONTEXT) -> Result[OUT]:
         cls_name = self.__class__.__name__
+        next_unit = self._next
 
-        if isinstance(self._next, MissingType):
+        if next_unit is MISSING:
             raise NotImplementedError(f"[{cls_name}] next unit is not set")
 
         try:
@@ -121,7 +133,7 @@ class RunUnit(FlowUnit[CONTEXT, OUT]):
             return Result.error(error)
 
         logger.info("[%s] completed", cls_name)
-        return self._next(context)
+        return next_unit(context)
 
     @abc.abstractmethod
     def run(self, context: CONTEXT) -> None:
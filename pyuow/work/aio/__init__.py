@@ -1,6 +1,8 @@
 from .base import BaseUnitProxy, BaseWorkManager
+from .loop import use_uvloop
 
 __all__ = (
     "BaseUnitProxy",
     "BaseWorkManager",
+    "use_uvloop",
 )
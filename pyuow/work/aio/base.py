@@ -11,8 +11,10 @@ OUT = t.TypeVar("OUT")
 
 
 class BaseUnitProxy(BaseUnit[CONTEXT, OUT], ABC):
-    async def do_with(self, context: CONTEXT) -> Result[OUT]:
-        return await self(context)
+    def do_with(
+        self, context: CONTEXT
+    ) -> t.Coroutine[t.Any, t.Any, Result[OUT]]:
+        return self(context)
 
 
 class BaseWorkManager(ABC):
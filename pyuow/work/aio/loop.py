@@ -0,0 +1,19 @@
+import asyncio
+
+_POLICY_INSTALLED = False
+
+
+def use_uvloop() -> bool:
+    global _POLICY_INSTALLED
+
+    if _POLICY_INSTALLED:
+        return True
+
+    try:
+        import uvloop  # type: ignore[import-not-found]
+    except ImportError:  # pragma: no cover
+        return False
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    _POLICY_INSTALLED = True
+    return True
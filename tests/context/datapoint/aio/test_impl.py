@@ -1,9 +1,19 @@
-from unittest.mock import AsyncMock, Mock
+import typing as t
+from unittest.mock import Mock
 
 import pytest
 
-from pyuow.datapoint import BaseDataPointSpec, DataPointIsNotProducedError
-from pyuow.datapoint.aio import ConsumesDataPoints, ProducesDataPoints
+from pyuow.datapoint import (
+    BaseDataPointContainer,
+    BaseDataPointSpec,
+    DataPointIsNotProducedError,
+)
+from pyuow.datapoint.aio import (
+    BaseDataPointConsumer,
+    BaseDataPointProducer,
+    ConsumesDataPoints,
+    ProducesDataPoints,
+)
 
 FakeDatapoint = BaseDataPointSpec("fake_datapoint", int)
 FakeExtraDatapoint = BaseDataPointSpec("fake_extra_datapoint", float)
@@ -17,7 +27,45 @@ class FakeObjThatConsumesDataPoints(ConsumesDataPoints):
     _consumes = {FakeDatapoint}
 
 
+class FakeProducerSpy(BaseDataPointProducer[t.Any]):
+    def __init__(self) -> None:
+        self.calls: t.List[t.Tuple[t.Any, ...]] = []
+
+    async def add(self, *datapoints: BaseDataPointContainer[t.Any]) -> None:
+        self.calls.append(datapoints)
+
+
+class FakeConsumerSpy(BaseDataPointConsumer[t.Any]):
+    def __init__(
+        self,
+        datapoints: t.Dict[
+            BaseDataPointSpec[t.Any], BaseDataPointContainer[t.Any]
+        ],
+    ) -> None:
+        self.calls: t.List[t.Tuple[t.Any, ...]] = []
+        self._datapoints = datapoints
+
+    async def get(
+        self, *specs: BaseDataPointSpec[t.Any]
+    ) -> t.Dict[BaseDataPointSpec[t.Any], BaseDataPointContainer[t.Any]]:
+        self.calls.append(specs)
+        return self._datapoints
+
+
 class TestConsumesDataPoints:
+    def test_async_produces_and_consumes_should_be_frozen_at_class_creation(
+        self,
+    ) -> None:
+        # then
+        assert FakeObjThatProducesDataPoints._produces == frozenset(
+            {FakeDatapoint}
+        )
+        assert isinstance(FakeObjThatProducesDataPoints._produces, frozenset)
+        assert FakeObjThatConsumesDataPoints._consumes == frozenset(
+            {FakeDatapoint}
+        )
+        assert isinstance(FakeObjThatConsumesDataPoints._consumes, frozenset)
+
     def test_async_to_should_delegate_to_provider_proxy(self) -> None:
         # given
         fake_producer = Mock()
@@ -31,44 +79,59 @@ class TestConsumesDataPoints:
         self,
     ) -> None:
         # given
-        fake_producer = AsyncMock()
+        fake_producer = FakeProducerSpy()
         obj_that_produces = FakeObjThatProducesDataPoints()
         datapoint = FakeDatapoint(1)
         # when
         await obj_that_produces.to(fake_producer).add(datapoint)
         # then
-        fake_producer.add.assert_awaited_once_with(datapoint)
+        assert fake_producer.calls == [(datapoint,)]
+
+    async def test_async_to_add_should_delegate_all_datapoints_in_one_call(
+        self,
+    ) -> None:
+        # given
+        fake_producer = FakeProducerSpy()
+        obj_that_produces = FakeObjThatProducesDataPoints()
+        datapoint = FakeDatapoint(1)
+        extra_datapoint = FakeExtraDatapoint(1.0)
+        # when
+        await obj_that_produces.to(fake_producer).add(
+            datapoint, extra_datapoint
+        )
+        # then
+        assert fake_producer.calls == [(datapoint, extra_datapoint)]
 
     async def test_async_to_add_should_fail_if_at_least_one_required_datapoint_is_missing(
         self,
     ) -> None:
         # given
-        fake_producer = AsyncMock()
+        fake_producer = FakeProducerSpy()
         obj_that_produces = FakeObjThatProducesDataPoints()
         # when / then
         with pytest.raises(DataPointIsNotProducedError):
             await obj_that_produces.to(fake_producer).add()
 
+        assert fake_producer.calls == []
+
     async def test_async_out_of_should_delegate_names_to_consumer(
         self,
     ) -> None:
         # given
-        fake_consumer = AsyncMock()
         datapoint = FakeDatapoint(1)
-        fake_consumer.get.return_value = {FakeDatapoint: datapoint}
+        fake_consumer = FakeConsumerSpy({FakeDatapoint: datapoint})
         obj_that_consumes = FakeObjThatConsumesDataPoints()
         # when
         await obj_that_consumes.out_of(fake_consumer)
         # then
-        fake_consumer.get.assert_awaited_once_with(FakeDatapoint)
+        assert fake_consumer.calls == [(FakeDatapoint,)]
 
     async def test_async_out_of_should_fail_if_at_least_one_required_datapoint_is_missing(
         self,
     ) -> None:
         # given
-        fake_consumer = AsyncMock()
         datapoint = FakeExtraDatapoint(1.0)
-        fake_consumer.get.return_value = {FakeExtraDatapoint: datapoint}
+        fake_consumer = FakeConsumerSpy({FakeExtraDatapoint: datapoint})
         obj_that_consumes = FakeObjThatConsumesDataPoints()
         # when / then
         with pytest.raises(
@@ -21,7 +21,34 @@ class FakeObjThatConsumesDataPoints(ConsumesDataPoints):
     _consumes = {FakeDatapoint}
 
 
+class TestBaseDataPointSpec:
+    def test_spec_hash_should_be_cached_and_match_equal_specs(self) -> None:
+        # given
+        spec = BaseDataPointSpec("fake_datapoint", int)
+        equal_spec = BaseDataPointSpec("fake_datapoint", int)
+        # when
+        first = hash(spec)
+        second = hash(spec)
+        # then
+        assert first == second == hash(equal_spec)
+        assert spec == equal_spec
+        assert {spec: 1}[equal_spec] == 1
+
+
 class TestConsumesDataPoints:
+    def test_produces_and_consumes_should_be_frozen_at_class_creation(
+        self,
+    ) -> None:
+        # then
+        assert FakeObjThatProducesDataPoints._produces == frozenset(
+            {FakeDatapoint}
+        )
+        assert isinstance(FakeObjThatProducesDataPoints._produces, frozenset)
+        assert FakeObjThatConsumesDataPoints._consumes == frozenset(
+            {FakeDatapoint}
+        )
+        assert isinstance(FakeObjThatConsumesDataPoints._consumes, frozenset)
+
     def test_to_should_delegate_to_provider_proxy(self) -> None:
         # given
         fake_producer = Mock()
@@ -2,13 +2,14 @@ from pathlib import Path
 from typing import Iterator
 
 import pytest
-from sqlalchemy import NullPool, text
+from sqlalchemy import NullPool
 from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
 from testcontainers.postgres import (  # type: ignore[import-untyped]
     PostgresContainer,
 )
 
 TEST_DB_SCHEMA = Path(__file__).parent.parent / "test_db_schema.sql"
+SQL_INSTRUCTIONS = TEST_DB_SCHEMA.read_text(encoding="utf-8")
 
 
 @pytest.fixture(scope="session")
@@ -27,7 +28,9 @@ def async_engine(async_postgres: PostgresContainer) -> Iterator[AsyncEngine]:  #
         poolclass=NullPool,
         echo=True,
         echo_pool=True,
-        pool_pre_ping=True,
+        # the containerized database lives for the whole session, so
+        # liveness pings on every checkout would only add round trips
+        pool_pre_ping=False,
     )
     yield engine
 
@@ -35,7 +38,10 @@ def async_engine(async_postgres: PostgresContainer) -> Iterator[AsyncEngine]:  #
 @pytest.fixture(scope="session", autouse=True)
 async def migrated_db(async_engine: AsyncEngine) -> None:
     async with async_engine.connect() as conn, conn.begin():
-        sql_instructions = TEST_DB_SCHEMA.read_text(encoding="utf-8")
-        statements = sql_instructions.split(";")
-        for statement in statements:
-            await conn.execute(text(statement))
+        # asyncpg cannot run multi-statement scripts through prepared
+        # statements, so the script goes through the driver connection
+        # which uses the simple query protocol
+        raw_connection = await conn.get_raw_connection()
+        driver_connection = raw_connection.driver_connection
+        assert driver_connection is not None
+        await driver_connection.execute(SQL_INSTRUCTIONS)
@@ -1,14 +1,33 @@
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, Mock
 
 import pytest
 from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
 
 from pyuow.contrib.sqlalchemy.aio.work import (
     SqlAlchemyTransaction,
     SqlAlchemyTransactionManager,
+    ensure_async_pool,
 )
 
 
+class TestEnsureAsyncPool:
+    def test_ensure_async_pool_should_raise_on_sync_queue_pool(self) -> None:
+        # given
+        engine = Mock(pool=QueuePool(Mock()))
+        # when / then
+        with pytest.raises(TypeError):
+            ensure_async_pool(engine)
+
+    def test_ensure_async_pool_should_allow_async_adapted_queue_pool(
+        self,
+    ) -> None:
+        # given
+        engine = Mock(pool=AsyncAdaptedQueuePool(Mock()))
+        # when / then
+        ensure_async_pool(engine)
+
+
 @pytest.mark.skip_on_ci
 class TestSqlAlchemyTransaction:
     async def test_async_rollback_should_call_transaction_provider_original_rollback(
@@ -2,13 +2,13 @@ from pathlib import Path
 from typing import Iterator
 
 import pytest
-from sqlalchemy import text
 from sqlalchemy.engine import Engine, create_engine
 from testcontainers.postgres import (  # type: ignore[import-untyped]
     PostgresContainer,
 )
 
 TEST_DB_SCHEMA = Path(__file__).parent / "test_db_schema.sql"
+SQL_INSTRUCTIONS = TEST_DB_SCHEMA.read_text(encoding="utf-8")
 
 
 @pytest.fixture(scope="session")
@@ -23,7 +23,9 @@ def engine(postgres: PostgresContainer) -> Iterator[Engine]:  # type: ignore[no-
         postgres.get_connection_url(),
         echo=True,
         echo_pool=True,
-        pool_pre_ping=True,
+        # the containerized database lives for the whole session, so
+        # liveness pings on every checkout would only add round trips
+        pool_pre_ping=False,
     )
     yield engine
 
@@ -31,7 +33,4 @@ def engine(postgres: PostgresContainer) -> Iterator[Engine]:  # type: ignore[no-
 @pytest.fixture(scope="session", autouse=True)
 def migrated_db(engine: Engine) -> None:
     with engine.connect() as conn, conn.begin():
-        sql_instructions = TEST_DB_SCHEMA.read_text(encoding="utf-8")
-        statements = sql_instructions.split(";")
-        for statement in statements:
-            conn.execute(text(statement))
+        conn.exec_driver_sql(SQL_INSTRUCTIONS)
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import typing as t
-from dataclasses import dataclass, replace
+from dataclasses import dataclass
 from uuid import uuid4
 
 import pytest
@@ -33,7 +33,18 @@ class FakeVersionedEntity(VersionedEntity[FakeEntityId]):
     field: str = t.cast(t.Any, MISSING)
 
     def change_field(self, value: str) -> FakeVersionedEntity:
-        return replace(self, field=value)
+        return FakeVersionedEntity(
+            id=self.id, version=self.version, field=value
+        )
+
+    def __hash__(self) -> int:
+        cached = self.__dict__.get("_hash")
+
+        if cached is None:
+            cached = hash((self.id, self.field))
+            object.__setattr__(self, "_hash", cached)
+
+        return cached
 
 
 @dataclass(frozen=True)
@@ -41,7 +52,21 @@ class FakeAuditedEntity(AuditedEntity[FakeEntityId]):
     field: str = t.cast(t.Any, MISSING)
 
     def change_field(self, value: str) -> FakeAuditedEntity:
-        return replace(self, field=value)
+        return FakeAuditedEntity(
+            id=self.id,
+            created_date=self.created_date,
+            updated_date=self.updated_date,
+            field=value,
+        )
+
+    def __hash__(self) -> int:
+        cached = self.__dict__.get("_hash")
+
+        if cached is None:
+            cached = hash((self.id, self.field))
+            object.__setattr__(self, "_hash", cached)
+
+        return cached
 
 
 @dataclass(frozen=True)
@@ -49,7 +74,16 @@ class FakeEntity(Entity[FakeEntityId]):
     field: str = t.cast(t.Any, MISSING)
 
     def change_field(self, value: str) -> FakeEntity:
-        return replace(self, field=value)
+        return FakeEntity(id=self.id, field=value)
+
+    def __hash__(self) -> int:
+        cached = self.__dict__.get("_hash")
+
+        if cached is None:
+            cached = hash((self.id, self.field))
+            object.__setattr__(self, "_hash", cached)
+
+        return cached
 
 
 class FakeEntityRepository(
@@ -184,6 +218,19 @@ class TestSqlAlchemyEntityRepository:
         # then
         assert result == entity
 
+    def test_find_should_see_uncommitted_entity_within_transaction(
+        self, audited_entity_repository: FakeAuditedEntityRepository
+    ) -> None:
+        # given
+        entity = FakeAuditedEntity(id=FakeEntityId(uuid4()), field="test")
+        transaction_manager = audited_entity_repository._transaction_manager
+        # when
+        with transaction_manager.transaction():
+            audited_entity_repository.add(entity)
+            result = audited_entity_repository.find(entity.id)
+        # then
+        assert result == entity
+
     def test_find_all_should_find_all_entities(
         self, audited_entity_repository: FakeAuditedEntityRepository
     ) -> None:
@@ -274,7 +321,9 @@ class TestSqlAlchemyEntityRepository:
         # when / then
         with pytest.raises(NoResultFound):
             versioned_entity_repository.update(
-                replace(entity, version=Version(123))
+                FakeVersionedEntity(
+                    id=entity.id, version=Version(123), field=entity.field
+                )
             )
 
     def test_update_non_audited_entity_should_update_only_entity(
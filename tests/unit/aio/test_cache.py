@@ -0,0 +1,124 @@
+import typing as t
+from dataclasses import dataclass
+from unittest.mock import Mock
+
+from pyuow.context import BaseParams
+from pyuow.context.datapoint.aio.in_memory import InMemoryDataPointContext
+from pyuow.datapoint import BaseDataPointSpec
+from pyuow.datapoint.aio import ConsumesDataPoints
+from pyuow.types import MISSING, MissingType
+from pyuow.unit.aio import (
+    BaseConditionCacheStore,
+    ConditionalUnit,
+    cached_condition,
+)
+from pyuow.unit.cache import ConditionCacheKey
+
+FakeDatapoint = BaseDataPointSpec("fake_datapoint", str)
+
+
+@dataclass(frozen=True)
+class FakeParams(BaseParams):
+    pass
+
+
+@dataclass(frozen=True)
+class FakeContext(InMemoryDataPointContext[FakeParams]):
+    pass
+
+
+class FakeStore(BaseConditionCacheStore):
+    def __init__(self) -> None:
+        self.storage: t.Dict[ConditionCacheKey, bool] = {}
+
+    async def get(self, key: ConditionCacheKey) -> t.Union[bool, MissingType]:
+        return self.storage.get(key, MISSING)
+
+    async def set(self, key: ConditionCacheKey, value: bool) -> None:
+        self.storage[key] = value
+
+
+async def build_context(value: str) -> FakeContext:
+    context = FakeContext(params=FakeParams())
+    await context.add(FakeDatapoint(value))
+    return context
+
+
+class TestCachedCondition:
+    async def test_async_cached_condition_should_run_condition_once_per_key(
+        self,
+    ) -> None:
+        # given
+        calls = []
+
+        class FakeConditionalUnit(
+            ConditionalUnit[FakeContext, None], ConsumesDataPoints
+        ):
+            _consumes = {FakeDatapoint}
+
+            @cached_condition()
+            async def condition(self, context: FakeContext) -> bool:
+                calls.append(context)
+                consumed = await self.out_of(context)
+                return consumed[FakeDatapoint] == "test"
+
+        unit = FakeConditionalUnit(on_failure=Mock())
+        # when
+        first = await unit.condition(await build_context("test"))
+        second = await unit.condition(await build_context("test"))
+        # then
+        assert first is True
+        assert second is True
+        assert len(calls) == 1
+
+    async def test_async_cached_condition_should_key_on_datapoint_values(
+        self,
+    ) -> None:
+        # given
+        calls = []
+
+        class FakeConditionalUnit(
+            ConditionalUnit[FakeContext, None], ConsumesDataPoints
+        ):
+            _consumes = {FakeDatapoint}
+
+            @cached_condition()
+            async def condition(self, context: FakeContext) -> bool:
+                calls.append(context)
+                consumed = await self.out_of(context)
+                return consumed[FakeDatapoint] == "test"
+
+        unit = FakeConditionalUnit(on_failure=Mock())
+        # when
+        passed = await unit.condition(await build_context("test"))
+        failed = await unit.condition(await build_context("qwerty"))
+        # then
+        assert passed is True
+        assert failed is False
+        assert len(calls) == 2
+
+    async def test_async_cached_condition_should_fall_back_to_store_on_local_miss(
+        self,
+    ) -> None:
+        # given
+        calls = []
+        store = FakeStore()
+
+        class FakeConditionalUnit(
+            ConditionalUnit[FakeContext, None], ConsumesDataPoints
+        ):
+            _consumes = {FakeDatapoint}
+
+            @cached_condition(store=store)
+            async def condition(self, context: FakeContext) -> bool:
+                calls.append(context)
+                consumed = await self.out_of(context)
+                return consumed[FakeDatapoint] == "test"
+
+        await store.set((("fake_datapoint", "test"),), True)
+        unit = FakeConditionalUnit(on_failure=Mock())
+        # when
+        result = await unit.condition(await build_context("test"))
+        # then
+        assert result is True
+        assert len(calls) == 0
@@ -0,0 +1,159 @@
+import typing as t
+from dataclasses import dataclass
+from unittest.mock import Mock
+
+from pyuow.context import BaseParams
+from pyuow.context.datapoint.in_memory import InMemoryDataPointContext
+from pyuow.datapoint import BaseDataPointSpec, ConsumesDataPoints
+from pyuow.types import MISSING, MissingType
+from pyuow.unit import (
+    BaseConditionCacheStore,
+    ConditionalUnit,
+    cached_condition,
+)
+from pyuow.unit.cache import ConditionCacheKey
+
+FakeDatapoint = BaseDataPointSpec("fake_datapoint", str)
+
+
+@dataclass(frozen=True)
+class FakeParams(BaseParams):
+    pass
+
+
+@dataclass(frozen=True)
+class FakeContext(InMemoryDataPointContext[FakeParams]):
+    pass
+
+
+class FakeStore(BaseConditionCacheStore):
+    def __init__(self) -> None:
+        self.storage: t.Dict[ConditionCacheKey, bool] = {}
+
+    def get(self, key: ConditionCacheKey) -> t.Union[bool, MissingType]:
+        return self.storage.get(key, MISSING)
+
+    def set(self, key: ConditionCacheKey, value: bool) -> None:
+        self.storage[key] = value
+
+
+def build_context(value: str) -> FakeContext:
+    context = FakeContext(params=FakeParams())
+    context.add(FakeDatapoint(value))
+    return context
+
+
+class TestCachedCondition:
+    def test_cached_condition_should_run_condition_once_per_key(self) -> None:
+        # given
+        calls = []
+
+        class FakeConditionalUnit(
+            ConditionalUnit[FakeContext, None], ConsumesDataPoints
+        ):
+            _consumes = {FakeDatapoint}
+
+            @cached_condition()
+            def condition(self, context: FakeContext) -> bool:
+                calls.append(context)
+                return self.out_of(context)[FakeDatapoint] == "test"
+
+        unit = FakeConditionalUnit(on_failure=Mock())
+        # when
+        first = unit.condition(build_context("test"))
+        second = unit.condition(build_context("test"))
+        # then
+        assert first is True
+        assert second is True
+        assert len(calls) == 1
+
+    def test_cached_condition_should_key_on_datapoint_values(self) -> None:
+        # given
+        calls = []
+
+        class FakeConditionalUnit(
+            ConditionalUnit[FakeContext, None], ConsumesDataPoints
+        ):
+            _consumes = {FakeDatapoint}
+
+            @cached_condition()
+            def condition(self, context: FakeContext) -> bool:
+                calls.append(context)
+                return self.out_of(context)[FakeDatapoint] == "test"
+
+        unit = FakeConditionalUnit(on_failure=Mock())
+        # when
+        passed = unit.condition(build_context("test"))
+        failed = unit.condition(build_context("qwerty"))
+        # then
+        assert passed is True
+        assert failed is False
+        assert len(calls) == 2
+
+    def test_cached_condition_should_fall_back_to_store_on_local_miss(
+        self,
+    ) -> None:
+        # given
+        calls = []
+        store = FakeStore()
+
+        class FakeConditionalUnit(
+            ConditionalUnit[FakeContext, None], ConsumesDataPoints
+        ):
+            _consumes = {FakeDatapoint}
+
+            @cached_condition(store=store)
+            def condition(self, context: FakeContext) -> bool:
+                calls.append(context)
+                return self.out_of(context)[FakeDatapoint] == "test"
+
+        store.set((("fake_datapoint", "test"),), True)
+        unit = FakeConditionalUnit(on_failure=Mock())
+        # when
+        result = unit.condition(build_context("test"))
+        # then
+        assert result is True
+        assert len(calls) == 0
+
+    def test_cached_condition_should_populate_store_on_miss(self) -> None:
+        # given
+        store = FakeStore()
+
+        class FakeConditionalUnit(
+            ConditionalUnit[FakeContext, None], ConsumesDataPoints
+        ):
+            _consumes = {FakeDatapoint}
+
+            @cached_condition(store=store)
+            def condition(self, context: FakeContext) -> bool:
+                return self.out_of(context)[FakeDatapoint] == "test"
+
+        unit = FakeConditionalUnit(on_failure=Mock())
+        # when
+        unit.condition(build_context("test"))
+        # then
+        assert store.storage == {(("fake_datapoint", "test"),): True}
+
+    def test_cached_condition_should_evict_least_recently_used_key(
+        self,
+    ) -> None:
+        # given
+        calls = []
+
+        class FakeConditionalUnit(
+            ConditionalUnit[FakeContext, None], ConsumesDataPoints
+        ):
+            _consumes = {FakeDatapoint}
+
+            @cached_condition(maxsize=1)
+            def condition(self, context: FakeContext) -> bool:
+                calls.append(context)
+                return self.out_of(context)[FakeDatapoint] == "test"
+
+        unit = FakeConditionalUnit(on_failure=Mock())
+        # when
+        unit.condition(build_context("test"))
+        unit.condition(build_context("qwerty"))
+        unit.condition(build_context("test"))
+        # then
+        assert len(calls) == 3
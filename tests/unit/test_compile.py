@@ -0,0 +1,37 @@
+import sys
+from unittest.mock import Mock
+
+import pytest
+
+from pyuow.unit.compile import jit_compiled
+
+
+class TestJitCompiled:
+    def test_jit_compiled_should_return_function_as_is_without_numba(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        # given
+        monkeypatch.setitem(sys.modules, "numba", None)
+
+        def predicate(value: int) -> bool:
+            return value > 0
+
+        # when / then
+        assert jit_compiled(predicate) is predicate
+
+    def test_jit_compiled_should_compile_function_with_numba(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        # given
+        compiled = Mock()
+        fake_numba = Mock(njit=Mock(return_value=Mock(return_value=compiled)))
+        monkeypatch.setitem(sys.modules, "numba", fake_numba)
+
+        def predicate(value: int) -> bool:
+            return value > 0
+
+        # when
+        result = jit_compiled(predicate)
+        # then
+        assert result is compiled
+        fake_numba.njit.assert_called_once_with(cache=True)
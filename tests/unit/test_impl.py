@@ -66,6 +66,18 @@ class TestUnits:
         # then
         assert flow.build() == unit1
 
+    def test_flow_unit_build_should_return_same_root_on_repeated_calls(
+        self,
+    ) -> None:
+        # given
+        class FakeUnit(FlowUnit[Mock, None]):
+            def __call__(self, context: Mock) -> Result[None]:
+                return Result.empty()
+
+        flow = FakeUnit() >> FakeUnit()
+        # when / then
+        assert flow.build() is flow.build()
+
     def test_complex_units_flow_should_behave_properly(self) -> None:
         # given
         @dataclass(frozen=True)
@@ -255,6 +267,12 @@ class TestUnits:
         # then
         assert result.is_error() is True
 
+    def test_units_should_not_allocate_instance_dict(self) -> None:
+        # given
+        unit: ErrorUnit[Mock, t.Any] = ErrorUnit(exc=Exception("test"))
+        # then
+        assert not hasattr(unit, "__dict__")
+
     def test_error_unit_should_behave_properly(self) -> None:
         # given
         mock_context = Mock()
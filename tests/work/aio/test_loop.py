@@ -0,0 +1,55 @@
+import asyncio
+import sys
+import typing as t
+from unittest.mock import Mock
+
+import pytest
+
+from pyuow.work.aio import loop
+from pyuow.work.aio.loop import use_uvloop
+
+
+@pytest.fixture(autouse=True)
+def reset_loop_policy() -> t.Iterator[None]:
+    loop._POLICY_INSTALLED = False
+    policy = asyncio.get_event_loop_policy()
+    yield
+    loop._POLICY_INSTALLED = False
+    asyncio.set_event_loop_policy(policy)
+
+
+class TestUseUvloop:
+    def test_use_uvloop_should_install_policy_if_uvloop_is_available(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        # given
+        fake_policy = asyncio.DefaultEventLoopPolicy()
+        fake_uvloop = Mock(EventLoopPolicy=Mock(return_value=fake_policy))
+        monkeypatch.setitem(sys.modules, "uvloop", fake_uvloop)
+        # when
+        installed = use_uvloop()
+        # then
+        assert installed is True
+        assert asyncio.get_event_loop_policy() is fake_policy
+
+    def test_use_uvloop_should_install_policy_only_once(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        # given
+        fake_uvloop = Mock(
+            EventLoopPolicy=Mock(return_value=asyncio.DefaultEventLoopPolicy())
+        )
+        monkeypatch.setitem(sys.modules, "uvloop", fake_uvloop)
+        # when
+        use_uvloop()
+        use_uvloop()
+        # then
+        fake_uvloop.EventLoopPolicy.assert_called_once()
+
+    def test_use_uvloop_should_return_false_if_uvloop_is_not_available(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        # given
+        monkeypatch.setitem(sys.modules, "uvloop", None)
+        # when / then
+        assert use_uvloop() is False
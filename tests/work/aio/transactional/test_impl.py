@@ -1,3 +1,4 @@
+import inspect
 import typing as t
 from contextlib import asynccontextmanager
 from dataclasses import dataclass
@@ -77,6 +78,23 @@ class TestTransactionalUnitProxy:
         assert result.is_ok()
         transaction.commit.assert_awaited_once()
 
+    async def test_do_with_should_return_unit_coroutine_without_wrapping(
+        self,
+    ) -> None:
+        # given
+        unit = SuccessUnit()
+        context = FakeContext(params=FakeParams())
+        transaction_manager = FakeTransactionManager(AsyncMock)
+        work_proxy = TransactionalUnitProxy(
+            transaction_manager=transaction_manager, unit=unit
+        )
+        # when
+        awaitable = work_proxy.do_with(context=context)
+        # then
+        assert not inspect.iscoroutinefunction(work_proxy.do_with)
+        assert inspect.iscoroutine(awaitable)
+        assert (await awaitable).is_ok()
+
     async def test_do_with_should_rollback_on_error(self) -> None:
         # given
         unit = FailureUnit()